@@ -0,0 +1,24 @@
+import numpy as np
+
+import tle_core
+
+L1 = b"1 25544U 98067A   24001.00000000  .00016717  00000-0  10270-3 0  9005"
+L2 = b"2 25544  51.6416 247.4627 0006703 130.5360 325.0288 15.72125391563537"
+
+
+def test_compute_perigees_lowercases_non_ascii_names():
+    feed = "ÉTOILE-1\n".encode("utf-8") + L1 + b"\n" + L2 + b"\n"
+    lines, names_lower, perigees = tle_core.compute_perigees(feed)
+    assert lines == ["ÉTOILE-1".encode("utf-8"), L1, L2]
+    assert names_lower.tolist() == ["étoile-1"]
+    assert np.char.find(names_lower, "ÉTOILE".lower())[0] >= 0
+    assert np.char.find(names_lower, "étoile")[0] >= 0
+    assert abs(perigees[0] - 348.3) < 0.1
+
+
+def test_compute_perigees_tolerates_non_utf8_names():
+    feed = "ÉTOILE-2\n".encode("latin-1") + L1 + b"\n" + L2 + b"\n"
+    lines, names_lower, perigees = tle_core.compute_perigees(feed)
+    assert lines[0] == "ÉTOILE-2".encode("latin-1")
+    assert names_lower.tolist() == ["\ufffdtoile-2"]
+    assert perigees.shape == (1,)
@@ -0,0 +1,38 @@
+import pytest
+
+import tle_core
+
+tle_parse = pytest.importorskip("tle_parse")
+
+L1 = b"1 25544U 98067A   24001.00000000  .00016717  00000-0  10270-3 0  9005"
+L2 = b"2 25544  51.6416 247.4627 0006703 130.5360 325.0288 15.72125391563537"
+
+FEEDS = [
+    b"",
+    b"ISS (ZARYA)\n" + L1 + b"\n" + L2 + b"\n",
+    b"ISS (ZARYA)\r\n" + L1 + b"\r\n" + L2 + b"\r\n",
+    b"ISS\r1 abc\r2 def\r",
+    b"ISS\r\r\n1 abc\n\r2 def",
+    b"\n\n  \t\nISS  \n   \n" + L1 + b"  \n\t" + L2 + b"\n\n",
+    b"junk\nISS\n" + L1 + b"\n" + L2 + b"\n1 orphan\n",
+    b"A\nB\n1 x\n2 y\nC\n1 z\n2 w",
+    b"A\n1 x\n1 y\n2 z\n",
+    b"A\n2 x\n1 y\n2 z",
+    b"A\x0b\n1 x\x0c\n2 y\r",
+]
+
+
+def _parse_python(tle_bytes, monkeypatch):
+    monkeypatch.setattr(tle_core, "_parse_tle_lines_c", None)
+    return tle_core.parse_tle_lines(tle_bytes)
+
+
+@pytest.mark.parametrize("feed", FEEDS)
+def test_c_parser_matches_python_fallback(feed, monkeypatch):
+    assert tle_parse.parse_tle_lines(feed) == _parse_python(feed, monkeypatch)
+
+
+def test_bare_cr_line_endings(monkeypatch):
+    expected = [b"ISS", b"1 abc", b"2 def"]
+    assert tle_parse.parse_tle_lines(b"ISS\r1 abc\r2 def\r") == expected
+    assert _parse_python(b"ISS\r1 abc\r2 def\r", monkeypatch) == expected
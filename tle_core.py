@@ -0,0 +1,106 @@
+# tle_core.py
+import math
+from typing import List, Tuple
+
+import numpy as np
+import requests
+import streamlit as st
+
+try:
+    from tle_parse import parse_tle_lines as _parse_tle_lines_c
+except ImportError:  # extension not built (`pip install -e .`); use pure Python
+    _parse_tle_lines_c = None
+
+BASE_URL = "https://celestrak.org/NORAD/elements/gp.php"
+EARTH_RADIUS_KM = 6378.137
+EARTH_MU_KM3_S2 = 398600.4418  # Earth's gravitational parameter (GM)
+TLE_LINE_LEN = 69
+
+
+@st.cache_resource(show_spinner=False)
+def _http_session() -> requests.Session:
+    # Shared across reruns and sessions so CelesTrak connections are kept alive
+    return requests.Session()
+
+
+@st.cache_data(show_spinner=False)
+def fetch_tle_bytes(params=None, custom_url: str | None = None) -> bytes:
+    if custom_url:
+        url = custom_url
+    else:
+        url = BASE_URL
+    try:
+        if custom_url:
+            r = _http_session().get(url, timeout=30)
+        else:
+            r = _http_session().get(url, params=params, timeout=30)
+        r.raise_for_status()
+        return r.content
+    except Exception as e:
+        raise RuntimeError(f"Failed to fetch TLE: {e}")
+
+
+def parse_tle_lines(tle_bytes: bytes) -> List[bytes]:
+    # Flat [name, l1, l2, name, l1, l2, ...]; entry i is lines[3 * i : 3 * i + 3]
+    if _parse_tle_lines_c is not None:
+        return _parse_tle_lines_c(tle_bytes)
+    lines = [ln.strip() for ln in tle_bytes.splitlines() if ln.strip()]
+    out = []
+    i = 0
+    while i + 2 < len(lines):
+        name, l1, l2 = lines[i], lines[i + 1], lines[i + 2]
+        if l1.startswith(b"1 ") and l2.startswith(b"2 "):
+            out.extend((name, l1, l2))
+            i += 3
+        else:
+            i += 1
+    return out
+
+
+def _float_or_nan(field: bytes) -> float:
+    try:
+        return float(field)
+    except ValueError:
+        return math.nan
+
+
+def _tle_column(rows: np.ndarray, start: int, stop: int) -> np.ndarray:
+    field = np.ascontiguousarray(rows[:, start:stop]).view(f"S{stop - start}").ravel()
+    try:
+        return field.astype(np.float64)
+    except ValueError:
+        # Malformed entries become NaN, which never passes the perigee mask
+        return np.array([_float_or_nan(f) for f in field], dtype=np.float64)
+
+
+def _perigee_km(n_rev_per_day, e):
+    # Element-wise, so it works on floats and on NumPy arrays alike
+    n_rad_s = n_rev_per_day * (2.0 * math.pi / 86400.0)
+    a_km = np.cbrt(EARTH_MU_KM3_S2 / (n_rad_s * n_rad_s))
+    return a_km * (1.0 - e) - EARTH_RADIUS_KM
+
+
+def perigee_alt_km_array(line2s: List[bytes]) -> np.ndarray:
+    # TLE line 2 is fixed-column: eccentricity (implied leading decimal point)
+    # in columns 27-33, mean motion in revs/day in columns 53-63.
+    rows = np.array(line2s, dtype=f"S{TLE_LINE_LEN}").view(np.uint8)
+    rows = rows.reshape(-1, TLE_LINE_LEN)
+    e = _tle_column(rows, 26, 33) * 1e-7
+    n_rev_per_day = _tle_column(rows, 52, 63)
+    # No early reject on mean motion alone: GTO/Molniya-type orbits run at
+    # 2-3 revs/day yet have perigees of a few hundred km, so they must stay.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return _perigee_km(n_rev_per_day, e)
+
+
+@st.cache_data(show_spinner=False)
+def compute_perigees(
+    tle_bytes: bytes,
+) -> Tuple[List[bytes], np.ndarray, np.ndarray]:
+    lines = parse_tle_lines(tle_bytes)
+    # Names stay text so case folding covers non-ASCII; line 2 stays bytes
+    names_lower = np.char.lower(
+        np.array([n.decode("utf-8", "replace") for n in lines[0::3]], dtype=str)
+    )
+    perigees = perigee_alt_km_array(lines[2::3])
+    return lines, names_lower, perigees
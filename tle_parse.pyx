@@ -0,0 +1,57 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# tle_parse.pyx -- C-level TLE parser; tle_core.py falls back to pure Python if unbuilt
+
+cdef extern from "Python.h":
+    object PyBytes_FromStringAndSize(const char *v, Py_ssize_t size)
+
+
+cdef inline bint _is_space(char c):
+    return c == c' ' or c'\t' <= c <= c'\r'
+
+
+cdef inline bint _is_tle_line(const char *s, Py_ssize_t n, char tag):
+    return n >= 2 and s[0] == tag and s[1] == c' '
+
+
+cpdef list parse_tle_lines(bytes tle_text):
+    cdef const char *buf = tle_text
+    cdef Py_ssize_t size = len(tle_text)
+    cdef Py_ssize_t pos = 0, start, end
+    # Sliding window over the last three non-blank lines
+    cdef const char *starts[3]
+    cdef Py_ssize_t lens[3]
+    cdef int pending = 0
+    cdef list out = []
+
+    while pos < size:
+        start = pos
+        # Line ends match bytes.splitlines(): \n, \r, or \r\n as one terminator
+        while pos < size and buf[pos] != c'\n' and buf[pos] != c'\r':
+            pos += 1
+        end = pos
+        if pos + 1 < size and buf[pos] == c'\r' and buf[pos + 1] == c'\n':
+            pos += 1
+        pos += 1
+        while start < end and _is_space(buf[start]):
+            start += 1
+        while end > start and _is_space(buf[end - 1]):
+            end -= 1
+        if start == end:
+            continue
+
+        starts[pending] = buf + start
+        lens[pending] = end - start
+        pending += 1
+        if pending < 3:
+            continue
+
+        if _is_tle_line(starts[1], lens[1], c'1') and _is_tle_line(starts[2], lens[2], c'2'):
+            out.append(PyBytes_FromStringAndSize(starts[0], lens[0]))
+            out.append(PyBytes_FromStringAndSize(starts[1], lens[1]))
+            out.append(PyBytes_FromStringAndSize(starts[2], lens[2]))
+            pending = 0
+        else:
+            starts[0], lens[0] = starts[1], lens[1]
+            starts[1], lens[1] = starts[2], lens[2]
+            pending = 2
+    return out